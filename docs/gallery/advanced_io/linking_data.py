@@ -55,6 +55,22 @@ PyNWB supports linking between files using external links.
 #
 # In the following we are creating two :py:meth:`~pynwb.base.TimeSeries` each written to a separate file.
 # We then show how we can integrate these files into a single NWBFile.
+#
+# All files in this tutorial are read and written with the same :py:class:`~hdmf.build.manager.BuildManager`
+# so that the NWB type map is only set up once. The two test files are written with the small ``write_nwbfile``
+# helper below. It opens the file with ``h5py`` itself to request the latest HDF5 file format
+# (``libver='latest'``), which uses a more compact file metadata layout, and hands the open file to
+# :py:class:`~pynwb.NWBHDF5IO` via the ``file`` argument. The other files in this tutorial are opened by path
+# and use the default HDF5 file format.
+#
+# .. warning::
+#
+#    Files written with ``libver='latest'`` cannot be read by older releases of the HDF5 library, e.g., those
+#    bundled with older installations of MATLAB and MatNWB. Only use it if everyone who needs to read the
+#    files has a recent HDF5 version.
+#
+# The data only holds values in the range 0 to 999, so we store it as ``int32`` rather than numpy's
+# default ``int64``.
 
 # sphinx_gallery_thumbnail_path = 'figures/gallery_thumbnails_linking_data.png'
 from datetime import datetime
@@ -62,17 +78,29 @@ from dateutil.tz import tzlocal
 from pynwb import NWBFile
 from pynwb import TimeSeries
 from pynwb import NWBHDF5IO
+from pynwb import get_manager
+from hdmf.backends.hdf5.h5_utils import H5DataIO
+import h5py
 import numpy as np
 
 # Create the base data
 start_time = datetime(2017, 4, 3, 11, tzinfo=tzlocal())
 create_date = datetime(2017, 4, 15, 12, tzinfo=tzlocal())
-data = np.arange(1000).reshape((100, 10))
-timestamps = np.arange(100)
+data = np.arange(1000, dtype=np.int32).reshape((100, 10))
+timestamps = np.arange(100, dtype=np.float64)
 filename1 = 'external1_example.nwb'
 filename2 = 'external2_example.nwb'
 filename3 = 'external_linkcontainer_example.nwb'
 filename4 = 'external_linkdataset_example.nwb'
+manager = get_manager()
+
+
+def write_nwbfile(path, nwbfile):
+    """Write an NWBFile to a new HDF5 file at path using the shared BuildManager"""
+    io = NWBHDF5IO(path, mode='w', manager=manager, file=h5py.File(path, 'w', libver='latest'))
+    io.write(nwbfile)
+    io.close()
+
 
 # Create the first file
 nwbfile1 = NWBFile(session_description='demonstrate external files',
@@ -86,25 +114,27 @@ test_ts1 = TimeSeries(name='test_timeseries1',
                       timestamps=timestamps)
 nwbfile1.add_acquisition(test_ts1)
 # Write the first file
-io = NWBHDF5IO(filename1, 'w')
-io.write(nwbfile1)
-io.close()
+write_nwbfile(filename1, nwbfile1)
+
+# Open the first file for reading. We keep it open and reuse it for the rest of this tutorial
+io1 = NWBHDF5IO(filename1, 'r', manager=manager)
+nwbfile1 = io1.read()
+timeseries_1 = nwbfile1.get_acquisition('test_timeseries1')
 
 # Create the second file
 nwbfile2 = NWBFile(session_description='demonstrate external files',
                    identifier='NWBE2',
                    session_start_time=start_time,
                    file_create_date=create_date)
-# Create the second file
+# Both recordings share the same timestamps, so rather than storing a second copy
+# we link to the timestamps we already wrote to the first file
 test_ts2 = TimeSeries(name='test_timeseries2',
                       data=data,
                       unit='SIunit',
-                      timestamps=timestamps)
+                      timestamps=H5DataIO(data=timeseries_1.timestamps, link_data=True))
 nwbfile2.add_acquisition(test_ts2)
 # Write the second file
-io = NWBHDF5IO(filename2, 'w')
-io.write(nwbfile2)
-io.close()
+write_nwbfile(filename2, nwbfile2)
 
 
 #####################
@@ -126,13 +156,11 @@ nwbfile4 = NWBFile(session_description='demonstrate external files',
 ####################
 # Step 2: Get the dataset you want to link to
 # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
-# Now let's open our test files and retrieve our timeseries.
+# We already opened our first test file for reading above, so we can retrieve the
+# dataset directly from the timeseries we read from it.
 #
 
-# Get the first timeseries
-io1 = NWBHDF5IO(filename1, 'r')
-nwbfile1 = io1.read()
-timeseries_1 = nwbfile1.get_acquisition('test_timeseries1')
+# Get the data of the first timeseries
 timeseries_1_data = timeseries_1.data
 
 ####################
@@ -171,11 +199,10 @@ nwbfile4.add_acquisition(test_ts5)
 #
 from pynwb import NWBHDF5IO
 
-io4 = NWBHDF5IO(filename4, 'w')
+io4 = NWBHDF5IO(filename4, 'w', manager=manager)
 io4.write(nwbfile4,
           link_data=True)     # <-------- Specify default behavior to link rather than copy data
 io4.close()
-io1.close()
 
 #####################
 # .. note::
@@ -192,13 +219,12 @@ io1.close()
 #
 # Appending to files and linking is made possible by passing around the same
 # :py:class:`~hdmf.build.manager.BuildManager`. You can get a manager to pass around
-# using the :py:meth:`~pynwb.get_manager` function.
+# using the :py:meth:`~pynwb.get_manager` function. In this tutorial, we created ``manager``
+# with :py:meth:`~pynwb.get_manager` at the very beginning and have been passing it to every
+# :py:class:`~pynwb.NWBHDF5IO` since, so we simply keep using it here. Reusing one manager also
+# means that the NWB type map is only set up once rather than for every file we open.
 #
 
-from pynwb import get_manager
-
-manager = get_manager()
-
 ####################
 # .. tip::
 #
@@ -207,14 +233,10 @@ manager = get_manager()
 ####################
 # Step 1: Get the container object you want to link to
 # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
-# Now let's open our test files and retrieve our timeseries.
+# We reuse the first timeseries we read from our first test file above, which is still open,
+# and open our second test file to retrieve the second timeseries.
 #
 
-# Get the first timeseries
-io1 = NWBHDF5IO(filename1, 'r', manager=manager)
-nwbfile1 = io1.read()
-timeseries_1 = nwbfile1.get_acquisition('test_timeseries1')
-
 # Get the second timeseries
 io2 = NWBHDF5IO(filename2, 'r', manager=manager)
 nwbfile2 = io2.read()
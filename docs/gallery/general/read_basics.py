@@ -122,6 +122,30 @@ with DandiAPIClient() as client:
 io = NWBHDF5IO(s3_path, mode="r", driver="ros3")
 nwbfile = io.read()
 
+####################
+# .. tip::
+#
+#    Instead of letting :py:class:`~pynwb.NWBHDF5IO` open the file, you can also pass an :py:class:`h5py.File`
+#    object that you opened yourself using the ``file`` argument. This lets you tune how HDF5 accesses the file.
+#    For example, when reading many image frames from the same dataset, you can increase the size of the HDF5
+#    chunk cache from its default of 1 MB to 64 MB (``rdcc_nbytes``) and use a correspondingly larger, prime
+#    number of hash table slots (``rdcc_nslots``).
+#
+#    .. code-block:: python
+#
+#        import h5py
+#
+#        h5_file = h5py.File(
+#            s3_path,
+#            mode="r",
+#            driver="ros3",
+#            rdcc_nbytes=64 * 1024 * 1024,
+#            rdcc_nslots=12421,
+#            rdcc_w0=0.75,
+#        )
+#        io = NWBHDF5IO(s3_path, mode="r", file=h5_file)
+#        nwbfile = io.read()
+
 ####################
 # Access stimulus data
 # --------------------
@@ -167,9 +191,12 @@ nwbfile.stimulus["StimulusPresentation"]
 # Accessing the ``data`` attribute of the :py:class:`~pynwb.image.OpticalSeries` object
 # does not read the data values, but presents an HDF5 object that can be indexed to read data.
 # You can use the ``[:]`` operator to read the entire data array into memory.
+# For large datasets, you can instead allocate the array yourself and have h5py read the data directly into it
+# using :py:meth:`h5py.Dataset.read_direct`, which avoids an extra copy of the data.
 
 stimulus_presentation = nwbfile.stimulus["StimulusPresentation"]
-all_stimulus_data = stimulus_presentation.data[:]
+all_stimulus_data = np.empty(stimulus_presentation.data.shape, dtype=stimulus_presentation.data.dtype)
+stimulus_presentation.data.read_direct(all_stimulus_data)
 
 ####################
 # Images may be 3D or 4D (grayscale or RGB), where the first dimension must be time (frame).
@@ -194,8 +221,9 @@ stimulus_presentation.data.shape
 
 frame_index = 31
 image = stimulus_presentation.data[frame_index]
-# Reverse the last dimension because the data were stored in BGR instead of RGB
-image = image[..., ::-1]
+# Reverse the last dimension because the data were stored in BGR instead of RGB.
+# This gives a contiguous RGB copy of the image.
+image = np.ascontiguousarray(image[..., ::-1])
 plt.imshow(image, aspect="auto")
 
 ####################
@@ -205,6 +233,14 @@ plt.imshow(image, aspect="auto")
 #   :alt: NWBFile stimulus image
 #   :align: center
 #
+# .. tip::
+#
+#    To read an irregular subset of frames, e.g., ``[42, 7, 19]``, index the dataset with a list or array of
+#    indices in a single read rather than reading one frame at a time. h5py requires these indices to be in
+#    increasing order, which also lets HDF5 read them as a few contiguous blocks instead of many single points.
+#    Sort the indices with :py:func:`numpy.argsort` before reading, and use the inverse permutation
+#    to restore the original order afterwards, as we do for the landscape images below.
+#
 #
 # Access single unit data
 # -----------------------
@@ -220,8 +256,12 @@ units = nwbfile.units
 
 ####################
 # We can view the single unit data as a :py:class:`~pandas.DataFrame`.
+# :py:meth:`~hdmf.common.table.DynamicTable.to_dataframe` reads every column of the table from the file,
+# so we use the ``exclude`` argument to skip columns that we do not need in the :py:class:`~pandas.DataFrame`.
+# Here, we leave out the spike times of all units, which we will instead read below in a single read of the
+# flat spike times array and its index, and then slice per unit.
 
-units_df = units.to_dataframe()
+units_df = units.to_dataframe(exclude={"spike_times"})
 units_df
 
 ####################
@@ -242,8 +282,10 @@ units["spike_times"][0]
 # -----------------------------------------------------
 # We can look at when these single units spike relative to when image stimuli were presented to the subject.
 # We will iterate over the first 3 units and get their spike times.
-# Then for each unit, we will iterate over each stimulus onset time and compute the spike times relative
-# to stimulus onset. Finally, we will create a raster plot and histogram of these aligned spike times.
+# Then for each unit, we will find the spikes that fall in a time window around each stimulus onset
+# and compute their times relative to stimulus onset. Because spike times are sorted, we can find the
+# first and last spike of every window at once using :py:func:`numpy.searchsorted`.
+# Finally, we will create a raster plot and histogram of these aligned spike times.
 
 before = 1.0  # in seconds
 after = 3.0
@@ -251,17 +293,24 @@ after = 3.0
 # Get the stimulus times for all stimuli
 stim_on_times = stimulus_presentation.timestamps[:]
 
+# Read the spike times of all units and the index into them once, rather than once per unit.
+# The spike times of all units are stored in a single flat array, and the index holds the
+# end position of each unit's spike times in that array.
+spike_times_index = nwbfile.units["spike_times"]
+all_spike_times = spike_times_index.target.data[:]
+spike_times_ends = spike_times_index.data[:]
+
 for unit in range(3):
-    unit_spike_times = nwbfile.units["spike_times"][unit]
-    trial_spikes = []
-    for time in stim_on_times:
-        # Compute spike times relative to stimulus onset
-        aligned_spikes = unit_spike_times - time
-        # Keep only spike times in a given time window around the stimulus onset
-        aligned_spikes = aligned_spikes[
-            (-before < aligned_spikes) & (aligned_spikes < after)
-        ]
-        trial_spikes.append(aligned_spikes)
+    unit_start = 0 if unit == 0 else spike_times_ends[unit - 1]
+    unit_spike_times = all_spike_times[unit_start:spike_times_ends[unit]]
+    # Find the spikes in a given time window around each stimulus onset
+    window_starts = np.searchsorted(unit_spike_times, stim_on_times - before, side="right")
+    window_ends = np.searchsorted(unit_spike_times, stim_on_times + after, side="left")
+    # Compute spike times relative to stimulus onset
+    trial_spikes = [
+        unit_spike_times[start:end] - time
+        for start, end, time in zip(window_starts, window_ends, stim_on_times)
+    ]
     fig, axs = plt.subplots(2, 1, sharex="all")
     plt.xlabel("time (s)")
     axs[0].eventplot(trial_spikes)
@@ -270,7 +319,7 @@ for unit in range(3):
     axs[0].set_title("unit {}".format(unit))
     axs[0].axvline(0, color=[0.5, 0.5, 0.5])
 
-    axs[1].hist(np.hstack(trial_spikes), 30)
+    axs[1].hist(np.concatenate(trial_spikes), 30)
     axs[1].axvline(0, color=[0.5, 0.5, 0.5])
 
 ####################
@@ -295,28 +344,50 @@ for unit in range(3):
 trials_df = nwbfile.trials.to_dataframe()
 trials_df
 
+####################
+# The ``category_name`` column holds one of a small number of category names for each trial.
+# Converting it to a :py:class:`pandas.Categorical` stores each name once and makes selecting
+# trials by category a comparison of integer codes rather than of strings.
+
+trials_df["category_name"] = trials_df["category_name"].astype("category")
+
 ####################
 # The :py:class:`~pynwb.file.NWBFile.stimulus` can be mapped one-to-one to each row (trial)
 # of :py:class:`~pynwb.file.NWBFile.trials` based on the ``stim_on_time`` column.
 
-assert np.all(stimulus_presentation.timestamps[:] == trials_df.stim_on_time[:])
+assert np.array_equal(stim_on_times, trials_df.stim_on_time.to_numpy())
 
 ####################
-# Visualize the first 3 images that were categorized as landscapes in the session:
+# Visualize the first 3 images that were categorized as landscapes in the session.
+# We reuse the stimulus timestamps we already read into ``stim_on_times`` and build a lookup
+# from stimulus onset time to frame index once, instead of reading and searching the timestamps
+# dataset again for every trial. We then read all the selected frames from the file at once with
+# :py:meth:`h5py.Dataset.read_direct` into a preallocated array, rather than reading one frame per trial.
+
+frame_index_by_time = {time: index for index, time in enumerate(stim_on_times)}
 
 stim_on_times_landscapes = trials_df[
     trials_df.category_name == "landscapes"
-].stim_on_time
-for time in stim_on_times_landscapes[:3]:
-    img = np.squeeze(
-        stimulus_presentation.data[
-            np.where(stimulus_presentation.timestamps[:] == time)
-        ]
-    )
-    # Reverse the last dimension because the data were stored in BGR instead of RGB
-    img = img[..., ::-1]
-    plt.figure()
-    plt.imshow(img, aspect="auto")
+].stim_on_time.to_numpy()
+frame_indices = np.array([frame_index_by_time[time] for time in stim_on_times_landscapes[:3]])
+landscape_images = np.empty(
+    (frame_indices.size,) + stimulus_presentation.data.shape[1:],
+    dtype=stimulus_presentation.data.dtype,
+)
+# h5py requires the selected indices to be in increasing order, so read the frames
+# in sorted order and then restore the original order
+order = np.argsort(frame_indices)
+inverse_order = np.argsort(order)
+stimulus_presentation.data.read_direct(landscape_images, source_sel=np.s_[frame_indices[order], ...])
+landscape_images = landscape_images[inverse_order]
+# Reverse the last dimension of all images at once because the data were stored in BGR instead of RGB.
+# This gives a contiguous RGB copy of the images.
+landscape_images = np.ascontiguousarray(landscape_images[..., ::-1])
+fig, axes = plt.subplots(
+    len(landscape_images), 1, squeeze=False, figsize=(6.4, 4.8 * len(landscape_images))
+)
+for ax, img in zip(axes[:, 0], landscape_images):
+    ax.imshow(img, aspect="auto")
 
 ####################
 #